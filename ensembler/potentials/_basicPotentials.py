@@ -2,7 +2,8 @@ import copy
 import numpy as np, sympy as sp
 
 from ensembler.util.basic_class import _baseClass, notImplementedERR
-from ensembler.util.ensemblerTypes import Iterable, Union, Dict, Number
+from ensembler.util.ensemblerTypes import Iterable, Union, Dict, Number, Tuple, Callable
+from ensembler.util.jit import cfunc, numba_available
 
 # from concurrent.futures.thread import ThreadPoolExecutor
 
@@ -242,6 +243,40 @@ class _potential1DCls(_potentialNDCls):
         """
         return np.squeeze(self._calculate_dVdpos(np.squeeze(np.array(positions))))
 
+    def _jit_functions(self) -> Union[Tuple[Callable, Callable], None]:
+        """
+            _jit_functions
+                compiles the simplified potential function and its position derivative for a single position with numba.
+                The functions are compiled as cfuncs, which numba types by their signature only. Kernels taking them as
+                arguments (like system._newtonian_simulation) are therefore compiled once for all potentials.
+                The compiled functions are cached, until the potential functions are updated.
+
+        Returns
+        -------
+        Union[Tuple[Callable, Callable], None]
+            the compiled energy and force function or None, if numba is not available or the energies are not
+            calculated from the symbolic function V of the potential.
+        """
+        if (not numba_available or type(self).ene is not _potential1DCls.ene or type(self).force is not _potential1DCls.force
+                or type(self)._update_functions is not _potentialNDCls._update_functions
+                or getattr(self._calculate_energies, "__name__", None) != "_lambdifygenerated"
+                or getattr(self._calculate_dVdpos, "__name__", None) != "_lambdifygenerated"):
+            return None
+
+        if (getattr(self, "_jit_V", None) is not self.V or not hasattr(self, "_jit_ene")):
+            try:
+                # numpy error model: divisions by zero give inf/nan, like the python functions do
+                jit = cfunc("float64(float64)", error_model="numpy")
+                self._jit_ene = jit(sp.lambdify(self.position, self.V, "math"))
+                self._jit_dVdpos = jit(sp.lambdify(self.position, self.dVdpos, "math"))
+            except Exception:
+                self._jit_ene = self._jit_dVdpos = None
+            self._jit_V = self.V
+
+        if (self._jit_ene is None):
+            return None
+        return self._jit_ene, self._jit_dVdpos
+
 
 class _potential2DCls(_potentialNDCls):
     '''
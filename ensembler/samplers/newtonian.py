@@ -7,7 +7,8 @@ Module: Sampler
 """
 
 from ensembler.samplers._basicSamplers import _samplerCls
-from ensembler.util.ensemblerTypes import systemCls as systemType, Union, Number
+from ensembler.util.ensemblerTypes import systemCls as systemType, Union, Number, Callable
+from ensembler.util.jit import njit
 
 
 class newtonianSampler(_samplerCls):
@@ -22,6 +23,9 @@ class newtonianSampler(_samplerCls):
 
     dt: float
 
+    # compiled version of step for one dimensional systems, used by system.simulate (see _get_compiled_step)
+    _compiled_step: Callable = None
+
     def __init__(self, dt=0.002):
         """
         __init__
@@ -35,6 +39,36 @@ class newtonianSampler(_samplerCls):
         super().__init__()
         self.dt = dt
 
+    @classmethod
+    def _get_compiled_step(cls) -> Callable:
+        """
+        _get_compiled_step
+            returns the compiled step function of the integrator, if it belongs to the step method in use.
+
+        Returns
+        -------
+        Callable
+            _compiled_step(position, velocity, force, dt, mass, dvdpos) -> (new Position, new Velocity, new Force)
+            or None, if the integrator has no compiled step function.
+        """
+        for integrator_class in cls.__mro__:
+            if ("step" in vars(integrator_class)):
+                return integrator_class._compiled_step if ("_compiled_step" in vars(integrator_class)) else None
+        return None
+
+
+@njit(error_model="numpy")
+def _velocity_verlet_step(position: float, velocity: float, force: float, dt: float, mass: float,
+                          dvdpos: Callable) -> (float, float, float):
+    """
+        _velocity_verlet_step
+            compiled version of velocityVerletIntegrator.step for one dimensional systems.
+    """
+    new_position = position + velocity * dt - ((0.5 * force * (dt ** 2)) / mass)
+    new_force = dvdpos(new_position)
+    new_velocity = velocity - ((0.5 * (force + new_force) * dt) / mass)
+    return new_position, new_velocity, new_force
+
 
 class velocityVerletIntegrator(newtonianSampler):
     """
@@ -45,6 +79,7 @@ class velocityVerletIntegrator(newtonianSampler):
     Verlet, Loup (1967). "Computer "Experiments" on Classical Fluids. I. Thermodynamical Properties of Lennard−Jones Molecules". Physical Review. 159 (1): 98–103.
     """
     name = "Verlocity Verlet Integrator"
+    _compiled_step = staticmethod(_velocity_verlet_step)
 
     def step(self, system: systemType) -> Union[Number, Number, Number]:
         """
@@ -83,6 +118,19 @@ class velocityVerletIntegrator(newtonianSampler):
         return new_position, new_velocity, new_forces
 
 
+@njit(error_model="numpy")
+def _position_verlet_step(position: float, velocity: float, force: float, dt: float, mass: float,
+                          dvdpos: Callable) -> (float, float, float):
+    """
+        _position_verlet_step
+            compiled version of positionVerletIntegrator.step for one dimensional systems.
+    """
+    new_force = dvdpos(position)
+    new_velocity = velocity - (new_force * dt / mass)
+    new_position = position + new_velocity * dt
+    return new_position, new_velocity, new_force
+
+
 class positionVerletIntegrator(newtonianSampler):
     """
         The position Verlet Integrator has similar properties as the verlocity Verlet Integrator.
@@ -90,6 +138,7 @@ class positionVerletIntegrator(newtonianSampler):
         Verlet, Loup (1967). "Computer "Experiments" on Classical Fluids. I. Thermodynamical Properties of Lennard−Jones Molecules". Physical Review. 159 (1): 98–103.
         """
     name = "Position Verlet Integrator"
+    _compiled_step = staticmethod(_position_verlet_step)
 
     def step(self, system: systemType) -> Union[Number, Number, Number]:
         """
@@ -125,6 +174,20 @@ class positionVerletIntegrator(newtonianSampler):
         return new_position, new_velocity, new_forces
 
 
+@njit(error_model="numpy")
+def _leap_frog_step(position: float, velocity: float, force: float, dt: float, mass: float,
+                    dvdpos: Callable) -> (float, float, float):
+    """
+        _leap_frog_step
+            compiled version of leapFrogIntegrator.step for one dimensional systems.
+    """
+    v_halft = velocity - ((0.5 * dt * force) / mass)
+    new_position = position + v_halft * dt
+    new_force = dvdpos(new_position)
+    new_velocity = v_halft - ((0.5 * new_force * dt) / mass)
+    return new_position, new_velocity, new_force
+
+
 class leapFrogIntegrator(newtonianSampler):
     """
      The leapFrogIntegrator is similar to the velocity Verlet method. Leapfrog integration is equivalent to
@@ -132,6 +195,7 @@ class leapFrogIntegrator(newtonianSampler):
      over each other.
     """
     name = "Leap Frog Integrator"
+    _compiled_step = staticmethod(_leap_frog_step)
 
     def step(self, system: systemType) -> Union[Number, Number, Number]:
         """
@@ -67,7 +67,7 @@ class conjugate_gradient(optimizer):
         f = system.potential.ene
         f_prime = system.potential.force
 
-        self.oldpos = system.current_state.position
+        self.oldpos = system._currentState.position
         self.newPos = np.squeeze(
             fmin_cg(f=f, fprime=f_prime, x0=self.oldpos, epsilon=self.epsilon, maxiter=1, disp=False))
 
@@ -124,7 +124,7 @@ class monteCarloIntegrator(stochasticSampler):
 
         # integrate
         # while no value in spaceRange was found, terminates in first run if no spaceRange
-        current_state = system.current_state
+        current_state = system._currentState
         self.oldpos = current_state.position
 
         while (True):
@@ -251,7 +251,7 @@ class metropolisMonteCarloIntegrator(stochasticSampler):
         """
 
         current_iteration = 0
-        current_state = system.current_state
+        current_state = system._currentState
         self.oldpos = current_state.position
         nDimensions = system.nDimensions
 
@@ -2,22 +2,21 @@
 Module: System
     This module shall be used to implement subclasses of system. It wraps all information needed and generated by a simulation.
 """
+import math
 import os
 import warnings
+from contextlib import contextmanager
 
 import numpy as np
-import pandas as pd
-import scipy.constants as const
 from tqdm import tqdm
 
-pd.options.mode.use_inf_as_na = True
-
 # Typing
 from ensembler.util.basic_class import _baseClass
 from ensembler.util.ensemblerTypes import samplerCls, conditionCls, potentialCls, Number, Union, Iterable, NoReturn, \
-    List
+    List, Callable
 
 from ensembler.util import dataStructure as data
+from ensembler.util.jit import njit
 
 from ensembler.samplers.newtonian import newtonianSampler
 from ensembler.samplers.stochastic import langevinIntegrator, metropolisMonteCarloIntegrator
@@ -25,6 +24,55 @@ from ensembler.samplers.stochastic import langevinIntegrator, metropolisMonteCar
 from ensembler.potentials.OneD import metadynamicsPotential as metadynamicsPotential1D, harmonicOscillatorPotential
 from ensembler.potentials.TwoD import metadynamicsPotential as metadynamicsPotential2D
 
+# gas constant in J/(mol*K) - same value as scipy.constants.gas_constant
+_gas_constant: float = 8.314462618
+
+
+@njit(cache=True)
+def _kinetic_njit(velocities: np.ndarray, mass: float) -> float:
+    """
+        _kinetic_njit
+            calculates the total kinetic energy of the given velocities.
+    """
+    return 0.5 * mass * np.dot(velocities, velocities)
+
+
+# types of state values, that are stored directly into the scalar trajectory buffers
+_scalar_types = (float, int, np.float64)
+
+
+@njit(error_model="numpy")
+def _newtonian_simulation(integrator_step: Callable, dt: float, mass: float, steps: int, save_every_state: int,
+                          position: float, velocity: float, force: float, ene, dvdpos,
+                          positions: np.ndarray, velocities: np.ndarray, forces: np.ndarray,
+                          total_energies: np.ndarray, potential_energies: np.ndarray, kinetic_energies: np.ndarray,
+                          start: int) -> (int, float, float, float):
+    """
+        _newtonian_simulation
+            simulates a one dimensional system with the compiled step of a newtonian integrator
+            (see newtonianSampler._get_compiled_step) and the compiled potential functions ene and dvdpos.
+            The states are stored into the trajectory buffers from index start on, in the same steps as system.simulate
+            does, except for the final state.
+            Returns the number of stored states and the final position, velocity and force.
+    """
+    saved = start
+    for step in range(steps):
+        position, velocity, force = integrator_step(position, velocity, force, dt, mass, dvdpos)
+
+        if (step % save_every_state == 0 and step != steps - 1):
+            potential_energy = ene(position)
+            kinetic_energy = 0.5 * mass * (velocity * velocity)
+            total_energy = potential_energy if (np.isnan(kinetic_energy)) else (kinetic_energy + potential_energy)
+
+            positions[saved] = position
+            velocities[saved] = velocity
+            forces[saved] = force
+            total_energies[saved] = total_energy
+            potential_energies[saved] = potential_energy
+            kinetic_energies[saved] = kinetic_energy
+            saved += 1
+    return saved - start, position, velocity, force
+
 
 class system(_baseClass):
     """
@@ -41,6 +89,16 @@ class system(_baseClass):
     nDimensions: int
     nStates: int
 
+    # initial number of states the trajectory buffers can hold
+    _traj_chunk: int = 1024
+    # if True, the property setters do not update the energies (see batched_updates)
+    _batch_updates: bool = False
+    # if True, simulate runs the loop with numba, whenever the system allows it (see _simulate_compiled)
+    _compiled_simulation: bool = True
+    # minimal number of steps, for which compiling the simulation loop pays off - the first compiled simulation
+    # compiles the loop (~0.7 s, ~50k python steps), each new potential its functions (~0.06 s, ~5k python steps)
+    _compiled_simulation_min_steps: int = 50000
+
     """
         Attributes
     """
@@ -61,6 +119,7 @@ class system(_baseClass):
     def potential(self, potential: potentialCls):
         # if(issubclass(potential.__class__, _potentialCls)):
         self._potential = potential
+        self._has_force = callable(getattr(potential, "force", None))
         # else:
         #     raise ValueError("Potential needs to be a subclass of potential")
 
@@ -139,7 +198,15 @@ class system(_baseClass):
 
     @property
     def current_state(self) -> state:
-        return self._currentState
+        """
+        a copy of the current state of the system.
+
+        Returns
+        -------
+        state
+            the current state, which is not changed by further simulation steps.
+        """
+        return self._currentState.copy()
 
     def set_current_state(self, current_position: Union[Number, Iterable[Number]],
                           current_velocities: Union[Number, Iterable[Number]] = 0,
@@ -165,15 +232,24 @@ class system(_baseClass):
         self._currentForce = current_force
         self._currentVelocities = current_velocities
         self._currentTemperature = current_temperature
-        self.currentState = self.state(self._currentPosition, self._currentTemperature, np.nan, np.nan, np.nan, np.nan,
-                                       np.nan)
 
         self._update_energies()
         self.update_current_state()
 
     @property
-    def trajectory(self) -> pd.DataFrame:
-        return pd.DataFrame(list(map(lambda x: x._asdict(), self._trajectory)), columns=list(self.state.__dict__["_fields"]))
+    def trajectory(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        columns = {}
+        for field in self._state_fields:
+            buffer = self._traj_buf[field]
+            if (buffer is None):
+                columns[field] = np.full(self._traj_len, np.nan)
+            elif (buffer.ndim == 1):
+                columns[field] = buffer[:self._traj_len]  # pandas copies the column
+            else:
+                columns[field] = list(buffer[:self._traj_len].copy())  # one ndarray per state
+        return pd.DataFrame(columns, columns=self._state_fields)
 
     @property
     def position(self) -> Union[Number, Iterable[Number]]:
@@ -182,10 +258,11 @@ class system(_baseClass):
     @position.setter
     def position(self, position: Union[Number, Iterable[Number]]):
         self._currentPosition = position
-        if (len(self.trajectory) == 0):
+        if (self._traj_len == 0):
             self.initial_position = self._currentPosition
-        self._update_energies()
-        self.update_current_state()
+        if (not self._batch_updates):
+            self._update_energies()
+            self.update_current_state()
 
     def set_position(self, position: Union[Number, Iterable[Number]]):
         self.position = position
@@ -205,11 +282,12 @@ class system(_baseClass):
     @velocity.setter
     def velocity(self, velocity: Union[Number, Iterable[Number]]):
         self._currentVelocities = velocity
-        self._update_energies()
-        self.update_current_state()
+        if (not self._batch_updates):
+            self._update_energies()
+            self.update_current_state()
 
     def set_velocities(self, velocities):
-        self.velocities = velocities
+        self.velocity = velocities
 
     @property
     def temperature(self) -> Number:
@@ -227,7 +305,8 @@ class system(_baseClass):
     def temperature(self, temperature: Number):
         self._temperature = temperature
         self._currentTemperature = temperature
-        self._update_energies()
+        if (not self._batch_updates):
+            self._update_energies()
 
     def set_temperature(self, temperature: Number):
         """
@@ -254,7 +333,7 @@ class system(_baseClass):
 
     def __init__(self, potential: potentialCls=harmonicOscillatorPotential(), sampler: samplerCls=metropolisMonteCarloIntegrator(), conditions: Iterable[conditionCls] = None,
                  temperature: Number = 298.0, start_position: (Iterable[Number] or Number) = None, mass: Number = 1,
-                 verbose: bool = True) -> NoReturn:
+                 verbose: bool = True, seed: int = None) -> NoReturn:
         """
             The system class is wrapping all components needed for a simulation.
             It can be used as the control unit for executing a simulation (simulate) and also to manage the generated data or input data.
@@ -275,6 +354,8 @@ class system(_baseClass):
             mass of the single particle
         verbose : bool, optional
             I can tell you a long iterative story...
+        seed : int, optional
+            seed of the random number generator, which draws the random start positions and velocities of the system
         """
 
         ################################
@@ -285,10 +366,15 @@ class system(_baseClass):
         self.nParticles = 1  # FUTURE: adapt it to be multiple particles
         self._mass = mass  # for one particle systems!!!!
         self._temperature = temperature
+        self._rng = np.random.default_rng(seed)
 
         # Output
-        self._currentState = self.state(**{key: np.nan for key in self.state.__dict__["_fields"]})
-        self._trajectory =[]
+        self._state_fields = list(self.state._fields)
+        self._currentState = self.state(**{key: np.nan for key in self._state_fields})
+        self._traj_buf = {field: None for field in self._state_fields}
+        self._traj_scalar = [None for _ in self._state_fields]
+        self._traj_len = 0
+        self._traj_capacity = self._traj_chunk
 
         # tmpvars - private:
         self._currentTotE: (Number) = np.nan
@@ -301,7 +387,7 @@ class system(_baseClass):
 
         # BUILD System
         ## Fundamental Parts:
-        self._potential = potential
+        self.potential = potential
         self._integrator = sampler
 
         if(conditions is None):
@@ -309,18 +395,21 @@ class system(_baseClass):
         else:
             self._conditions = conditions
 
-        ## set dim
-        if (potential.constants[potential.nDimensions] > 0):
-            self.nDimensions = potential.constants[potential.nDimensions]
+        ## set dim - as plain int, as it is compared in every position/velocity initialisation
+        nDimensions = int(potential.constants[potential.nDimensions])
+        if (nDimensions > 0):
+            self.nDimensions = nDimensions
         else:
             raise IOError(
                 "Could not estimate the disered Dimensionality as potential dim was <1 and no initial position was given.")
 
+        self._is_1d = (self.nDimensions == 1)
+
         ###is the potential a state dependent one? - needed for initial pos.
         if (hasattr(potential, "nStates")):
-            self.nStates = potential.constants[potential.nStates]
+            self.nStates = int(potential.constants[potential.nStates])
         else:
-            self.nstates = 1
+            self.nStates = 1
 
         # PREPARE THE SYSTEM
         # Only init velocities, if the samplers uses them
@@ -383,10 +472,10 @@ class system(_baseClass):
         if (init_position):
             self._init_position(initial_position=set_initial_position)
 
-        # Try to init the force
-        try:
+        # init the force, if the potential has one
+        if (self._has_force):
             self._currentForce = self.potential.force(self.initial_position)  # initialise forces!
-        except:
+        else:
             warnings.warn("Could not initialize the force of the potential? Check if you need it!")
 
         if (init_velocity):
@@ -400,7 +489,7 @@ class system(_baseClass):
         self.update_system_properties()
         self.update_current_state()
 
-        self._trajectory.append(self.current_state)
+        self._append_traj()
 
     def _init_position(self, initial_position: Union[Number, Iterable[Number]] = None) -> NoReturn:
         """
@@ -433,16 +522,11 @@ class system(_baseClass):
                 Initializes the initial velocity randomly.
 
         """
-        if (self.nStates > 1):
-            self._currentVelocities = [[self._gen_rand_vel() for dim in range(self.nDimensions)] for s in
-                                       range(self.nStates)] if (self.nDimensions > 1) else [self._gen_rand_vel() for
-                                                                                            state in
-                                                                                            range(self.nStates)]
-        else:
-            self._currentVelocities = [self._gen_rand_vel() for dim in range(self.nDimensions)] if (
-                    self.nDimensions > 1) else self._gen_rand_vel()
+        velocities = np.squeeze(self._rng.normal(0.0, self._velocity_sigma(), (self.nStates, self.nDimensions)))
+        self._currentVelocities = velocities[()] if (velocities.ndim == 0) else velocities.tolist()
 
-        self.veltemp = self.mass / const.gas_constant / 1000.0 * np.linalg.norm(self._currentVelocities) ** 2  # t
+        flat_velocities = velocities.ravel()
+        self.veltemp = self.mass / _gas_constant / 1000.0 * float(flat_velocities @ flat_velocities)  # t
 
         self.update_current_state()
         return self._currentVelocities
@@ -457,7 +541,19 @@ class system(_baseClass):
         Number, Iterable[Number]
             a randomly selected velocity
         """
-        return np.sqrt(const.gas_constant / 1000.0 * self.temperature / self.mass) * np.random.normal()
+        return self._velocity_sigma() * self._rng.standard_normal()
+
+    def _velocity_sigma(self) -> float:
+        """
+            _velocity_sigma
+                width of the velocity distribution sqrt(R*T/m) according to the temperature and mass.
+
+        Returns
+        -------
+        float
+            the standard deviation of the velocities
+        """
+        return math.sqrt(_gas_constant / 1000.0 * self.temperature / self.mass)
 
     def random_position(self) -> Union[Number, Iterable[Number]]:
         """
@@ -469,9 +565,9 @@ class system(_baseClass):
             a random position
         """
 
-        random_pos = np.squeeze(np.array(np.subtract(np.multiply(np.random.rand(self.nDimensions), 20), 10)))
-        if (len(random_pos.shape) == 0):
-            return np.float(random_pos)
+        random_pos = self._rng.uniform(-10.0, 10.0, self.nDimensions)
+        if (self._is_1d):
+            return float(random_pos[0])
         else:
             return random_pos
 
@@ -488,11 +584,17 @@ class system(_baseClass):
         Union[Iterable[Number], Number, np.nan]
             total kinetic energy.
         """
-        if (isinstance(self._currentVelocities, Number) or (isinstance(self._currentVelocities, Iterable) and all(
-                [isinstance(x, Number) and not np.isnan(x) for x in self._currentVelocities]))):
-            return np.sum(0.5 * self.mass * np.square(np.linalg.norm(self._currentVelocities)))
-        else:
+        if (self._currentVelocities is None):
             return np.nan
+        elif (type(self._currentVelocities) in _scalar_types):
+            velocity = self._currentVelocities
+            return np.nan if (velocity != velocity) else 0.5 * self.mass * velocity * velocity
+
+        velocities = np.ravel(np.asarray(self._currentVelocities, dtype=np.float64))
+        if (velocities.size == 0 or np.isnan(velocities).any()):
+            return np.nan
+        else:
+            return _kinetic_njit(velocities, float(self.mass))
 
     def calculate_total_potential_energy(self) -> Union[Iterable[Number], Number]:
         """
@@ -522,15 +624,46 @@ class system(_baseClass):
     def update_current_state(self) -> NoReturn:
         """
             updateCurrentState
-                update current state from the _current vars.
+                update current state (in place) from the _current vars.
+
+        Returns
+        -------
+        NoReturn
+        """
+        current_state = self._currentState
+        current_state.position = self._currentPosition
+        current_state.temperature = self._currentTemperature
+        current_state.total_system_energy = self._currentTotE
+        current_state.total_potential_energy = self._currentTotPot
+        current_state.total_kinetic_energy = self._currentTotKin
+        current_state.dhdpos = self._currentForce
+        current_state.velocity = self._currentVelocities
+
+    def _commit_step(self) -> NoReturn:
+        """
+            _commit_step
+                updates the energies, the temperature and the current state (in place) in one pass.
+                Does the same as update_system_properties followed by update_current_state.
 
         Returns
         -------
         NoReturn
         """
-        self._currentState = self.state(self._currentPosition, self._currentTemperature,
-                                        self._currentTotE, self._currentTotPot, self._currentTotKin,
-                                        self._currentForce, self._currentVelocities)
+        position = self._currentPosition
+        self._currentTotPot = total_potential_energy = self.potential.ene(position)
+        self._currentTotKin = total_kinetic_energy = self.calculate_total_kinetic_energy()
+        self._currentTotE = total_system_energy = total_potential_energy if (math.isnan(total_kinetic_energy)) else (
+                total_kinetic_energy + total_potential_energy)
+        self._currentTemperature = temperature = self.temperature
+
+        current_state = self._currentState
+        current_state.position = position
+        current_state.temperature = temperature
+        current_state.total_system_energy = total_system_energy
+        current_state.total_potential_energy = total_potential_energy
+        current_state.total_kinetic_energy = total_kinetic_energy
+        current_state.dhdpos = self._currentForce
+        current_state.velocity = self._currentVelocities
 
     def _update_temperature(self) -> NoReturn:
         """
@@ -556,8 +689,8 @@ class system(_baseClass):
         """
         self._currentTotPot = self.calculate_total_potential_energy()
         self._currentTotKin = self.calculate_total_kinetic_energy()
-        self._currentTotE = self._currentTotPot if (np.isnan(self._currentTotKin)) else np.add(self._currentTotKin,
-                                                                                               self._currentTotPot)
+        self._currentTotE = self._currentTotPot if (math.isnan(self._currentTotKin)) else (self._currentTotKin +
+                                                                                           self._currentTotPot)
 
     def _update_current_vars_from_current_state(self):
         """
@@ -569,13 +702,13 @@ class system(_baseClass):
         NoReturn
 
         """
-        self._currentPosition = self.current_state.position
-        self._currentTemperature = self.current_state.temperature
-        self._currentTotE = self.current_state.total_system_energy
-        self._currentTotPot = self.current_state.total_potential_energy
-        self._currentTotKin = self.state.total_kinetic_energy
-        self._currentForce = self.current_state.dhdpos
-        self._currentVelocities = self.current_state.velocity
+        self._currentPosition = self._currentState.position
+        self._currentTemperature = self._currentState.temperature
+        self._currentTotE = self._currentState.total_system_energy
+        self._currentTotPot = self._currentState.total_potential_energy
+        self._currentTotKin = self._currentState.total_kinetic_energy
+        self._currentForce = self._currentState.dhdpos
+        self._currentVelocities = self._currentState.velocity
 
     def _update_state_from_traj(self) -> NoReturn:
         """
@@ -587,10 +720,161 @@ class system(_baseClass):
         NoReturn
 
         """
-        self.currentState = self.state(**self.trajectory.iloc[-1].to_dict())
+        self._currentState = self._get_traj_state(self._traj_len - 1)
         self._update_current_vars_from_current_state()
         return
 
+    """
+        Trajectory Buffer
+    """
+
+    def _reserve_traj(self, n_states: int) -> NoReturn:
+        """
+            _reserve_traj
+                makes sure, that the trajectory buffers can hold n_states additional states without reallocation.
+
+        Parameters
+        ----------
+        n_states: int
+            number of states, that will be appended.
+
+        """
+        required = self._traj_len + n_states
+        if (required > self._traj_capacity):
+            self._traj_capacity = max(required, 2 * self._traj_capacity)
+            for field, buffer in self._traj_buf.items():
+                if (buffer is not None):
+                    new_buffer = np.empty((self._traj_capacity, *buffer.shape[1:]), dtype=np.float64)
+                    new_buffer[:self._traj_len] = buffer[:self._traj_len]
+                    self._traj_buf[field] = new_buffer
+            self._update_traj_layout()
+
+    def _update_traj_layout(self) -> NoReturn:
+        """
+            _update_traj_layout
+                collects the buffers of the scalar state fields (in the order of the state fields, None for the others),
+                so _append_traj can write scalar values without checking the buffer layout.
+        """
+        self._traj_scalar = [buffer if (buffer is not None and buffer.ndim == 1) else None for buffer in
+                             (self._traj_buf[field] for field in self._state_fields)]
+
+    @staticmethod
+    def _n_saved_states(steps: int, save_every_state: int) -> int:
+        """
+            _n_saved_states
+                gives the number of states simulate stores in the trajectory: the state after each save_every_state-th
+                step (except the last step) and the final state.
+
+        Parameters
+        ----------
+        steps: int
+            number of integration steps
+        save_every_state: int
+            save every n step.
+
+        Returns
+        -------
+        int
+            number of stored states
+        """
+        if (steps < 1):
+            return 1
+        return len(range(0, steps, save_every_state)) - int((steps - 1) % save_every_state == 0) + 1
+
+    def _append_traj(self) -> NoReturn:
+        """
+            _append_traj
+                stores the current state in the trajectory buffers (one numpy array per state field).
+                The buffers are allocated on the first append and doubled in size, if they are full.
+                Scalar values of scalar fields are written directly, all others go through _append_traj_field.
+
+        """
+        if (self._traj_len == self._traj_capacity):
+            self._reserve_traj(self._traj_capacity)
+
+        index = self._traj_len
+        for field, scalar_buffer, value in zip(self._state_fields, self._traj_scalar, self._currentState):
+            if (scalar_buffer is not None and type(value) in _scalar_types):
+                scalar_buffer[index] = value
+            elif (scalar_buffer is not None and value is None):
+                scalar_buffer[index] = np.nan
+            else:
+                self._append_traj_field(field, value)
+        self._traj_len += 1
+
+    def _append_traj_field(self, field: str, value: Union[Number, Iterable[Number]]) -> NoReturn:
+        """
+            _append_traj_field
+                stores the value of a state field at the current end of its trajectory buffer.
+                Allocates the buffer or changes its layout, if the value does not fit it
+                (e.g. a vector is stored in a buffer that so far only held scalar np.nan placeholders).
+
+        Parameters
+        ----------
+        field: str
+            name of the state field
+        value: Union[Number, Iterable[Number]]
+            value to be stored
+        """
+        buffer = self._traj_buf[field]
+        if (buffer is not None):  # values fitting the settled layout
+            if (value is None):
+                buffer[self._traj_len] = np.nan
+                return
+            elif (buffer.ndim > 1 or (type(value) is np.ndarray and value.ndim == 0)):
+                try:
+                    buffer[self._traj_len] = value
+                    return
+                except (ValueError, TypeError):
+                    pass
+
+        value = np.asarray(value, dtype=np.float64)
+        if (value.size == 1):
+            value = value.reshape(())
+
+        if (buffer is None):
+            buffer = np.empty((self._traj_capacity, *value.shape), dtype=np.float64)
+        elif (buffer.ndim == 1 and value.ndim > 0):  # so far only scalars (e.g. np.nan placeholders) were stored
+            new_buffer = np.empty((self._traj_capacity, *value.shape), dtype=np.float64)
+            new_buffer[:self._traj_len] = buffer[:self._traj_len].reshape((self._traj_len,) + (1,) * value.ndim)
+            buffer = new_buffer
+        elif (value.ndim > 0 and buffer.shape[1:] != value.shape):
+            if (np.prod(buffer.shape[1:]) != value.size):
+                raise ValueError("Could not append the " + field + " of the current state to the trajectory! \n "
+                                 "given shape: " + str(value.shape) + "\n Expected shape: " + str(buffer.shape[1:]))
+            value = value.reshape(buffer.shape[1:])
+
+        buffer[self._traj_len] = value
+        if (self._traj_buf[field] is not buffer):
+            self._traj_buf[field] = buffer
+            self._update_traj_layout()
+
+    def _get_traj_state(self, index: int) -> state:
+        """
+            _get_traj_state
+                rebuilds a state from the trajectory buffers.
+
+        Parameters
+        ----------
+        index: int
+            index of the state in the trajectory
+
+        Returns
+        -------
+        state
+            the state at the given trajectory index.
+        """
+        values = []
+        for field in self._state_fields:
+            buffer = self._traj_buf[field]
+            if (buffer is None):
+                values.append(np.nan)
+            elif (buffer.ndim == 1):
+                values.append(buffer[index])
+            else:
+                values.append(buffer[index].copy())
+        return self.state(*values)
+
     """
         Functionality
     """
@@ -614,6 +898,7 @@ class system(_baseClass):
             save every n step. (and leave out the rest) (default: 1 - each step)
         verbosity: bool, optional
             change the verbosity of the simulation. (default: True)
+            If the simulation loop is compiled (see _simulate_compiled), the progress bar is only updated at the end.
         _progress_bar_prefix: str, optional
             prefix of tqdm progress bar. (default: "Simulation")
 
@@ -628,40 +913,179 @@ class system(_baseClass):
             self._init_velocities()
 
         if (withdraw_traj):
-            self._trajectory = []
-            self._trajectory.append(self.current_state)
+            self.clear_trajectory()
+            self._append_traj()
 
+        self.update_system_properties()
         self.update_current_state()
+
+        # progressBar or no ProgressBar - short simulations are not worth a progress bar
+        progress_bar = tqdm(total=steps, desc=_progress_bar_prefix + " Simulation: ", mininterval=1.0,
+                            miniters=max(1, steps // 200), leave=verbosity, disable=(not verbosity or steps < 1000))
+
+        # the compiled simulation can not report its progress - the progress bar is completed at once
+        if (self._simulate_compiled(steps=steps, save_every_state=save_every_state)):
+            progress_bar.update(steps)
+            progress_bar.close()
+            return self.current_state
+
+        self._reserve_traj(self._n_saved_states(steps, save_every_state))
+
+        # Simulation loop - the state after each save_every_state-th step is stored
+        # self.step is only read by the conditions, without them it is only set at the stored steps
+        simulation_step = self._build_simulation_step()
+        step_conditions = len(self._conditions) > 0
+        for save_step in range(0, steps, save_every_state):
+            self.step = save_step
+            simulation_step()
+            if (save_step != steps - 1):
+                self._append_traj()
+
+            block_end = min(save_step + save_every_state, steps)
+            if (step_conditions):
+                for self.step in range(save_step + 1, block_end):
+                    simulation_step()
+            else:
+                for _ in range(save_step + 1, block_end):
+                    simulation_step()
+                self.step = block_end - 1
+
+            progress_bar.update(min(save_every_state, steps - save_step))
+        progress_bar.close()
+
+        self._append_traj()
+        return self.current_state
+
+    def _simulation_step(self) -> NoReturn:
+        """
+            _simulation_step
+                performs one step of the simulation, without storing it in the trajectory.
+
+        Returns
+        -------
+        NoReturn
+
+        """
+        # Do one simulation Step.
+        self.propagate()
+
+        # Apply Restraints, Constraints ...
+        self.apply_conditions()
+
+        # Calc new Energy&and other system properties
         self.update_system_properties()
 
-        # progressBar or no ProgressBar
-        if (verbosity):
-            iteration_queue = tqdm(range(steps), desc=_progress_bar_prefix + " Simulation: ", mininterval=1.0,
-                                   leave=verbosity)
-        else:
-            iteration_queue = range(steps)
+        # Set new State
+        self.update_current_state()
 
-        # Simulation loop
-        for self.step in iteration_queue:
+    def _build_simulation_step(self) -> Callable[[], NoReturn]:
+        """
+            _build_simulation_step
+                builds a function doing the same as _simulation_step for the current sampler, potential and conditions.
+                All methods needed in a step are looked up once and bound to local variables of the function, so the
+                simulation loop does not resolve the attribute chains again in every step. The energies and the
+                current state are updated in one pass by _commit_step, if the subclass does not override their updates.
+                If a subclass overrides propagate or apply_conditions, _simulation_step itself is returned.
 
-            # Do one simulation Step.
-            self.propagate()
+        Returns
+        -------
+        Callable[[], NoReturn]
+            function performing one simulation step
+        """
+        if (self._overrides("_simulation_step", "propagate", "apply_conditions")):
+            return self._simulation_step
 
-            # Apply Restraints, Constraints ...
-            self.apply_conditions()
+        sampler_step = self.sampler.step
+        conditions = tuple(condition.apply_coupled for condition in self._conditions)
 
-            # Calc new Energy&and other system properties
-            self.update_system_properties()
+        if (self._overrides("update_system_properties", "update_current_state", "_update_energies",
+                            "_update_temperature", "calculate_total_potential_energy")):
+            update_system_properties = self.update_system_properties
+            update_current_state = self.update_current_state
 
-            # Set new State
-            self.update_current_state()
+            def commit_step():
+                update_system_properties()
+                update_current_state()
+        else:
+            commit_step = self._commit_step
 
-            if (self.step % save_every_state == 0 and self.step != steps - 1):
-                self._trajectory.append(self.current_state)
+        def simulation_step():
+            self._currentPosition, self._currentVelocities, self._currentForce = sampler_step(self)
+            for apply_condition in conditions:
+                apply_condition()
+            commit_step()
 
+        return simulation_step
 
-        self._trajectory.append(self.current_state)
-        return self.current_state
+    def _overrides(self, *methods: str) -> bool:
+        """
+            _overrides
+                checks if the class of the system overrides one of the given methods of the system base class.
+        """
+        return any(getattr(type(self), method) is not getattr(system, method) for method in methods)
+
+    def _simulate_compiled(self, steps: int, save_every_state: int) -> bool:
+        """
+            _simulate_compiled
+                runs the simulation loop of simulate with numba (see _newtonian_simulation).
+                This is possible for a one dimensional system without conditions, that is sampled by a newtonian
+                integrator on a potential, which can be compiled (see _potential1DCls._jit_functions), for at least
+                _compiled_simulation_min_steps steps. Otherwise nothing is done and simulate uses the python loop.
+
+        Parameters
+        ----------
+        steps: int
+            number of integration steps
+        save_every_state: int
+            save every n step.
+
+        Returns
+        -------
+        bool
+            True, if the simulation was done.
+        """
+        state_fields = ("position", "velocity", "dhdpos", "temperature", "total_system_energy",
+                        "total_potential_energy", "total_kinetic_energy")
+        if (not self._compiled_simulation or steps < max(1, self._compiled_simulation_min_steps)
+                or len(self._conditions) > 0 or not isinstance(self.sampler, newtonianSampler) or self.sampler.verbose
+                or self.state is not data.basicState
+                or self._overrides("_simulation_step", "propagate", "apply_conditions", "update_system_properties",
+                                   "update_current_state", "_update_energies", "_update_temperature",
+                                   "calculate_total_potential_energy", "calculate_total_kinetic_energy",
+                                   "_reserve_traj", "_append_traj")
+                or any(np.size(value) != 1 for value in
+                       (self.mass, self._currentPosition, self._currentVelocities, self._currentForce))
+                or any(self._traj_buf[field] is None or self._traj_buf[field].ndim != 1 for field in state_fields)
+                or not hasattr(self.potential, "_jit_functions")):
+            return False
+
+        integrator_step = self.sampler._get_compiled_step()
+        jit_functions = self.potential._jit_functions()
+        if (integrator_step is None or jit_functions is None):
+            return False
+        ene, dvdpos = jit_functions
+
+        self._reserve_traj(self._n_saved_states(steps, save_every_state))
+        start = self._traj_len
+        buffers = self._traj_buf
+        position, velocity, force = (float(np.squeeze(value)) for value in
+                                     (self._currentPosition, self._currentVelocities, self._currentForce))
+
+        n_saved, position, velocity, force = _newtonian_simulation(
+            integrator_step, float(self.sampler.dt), float(np.squeeze(self.mass)), steps,
+            save_every_state, position, velocity, force, ene, dvdpos,
+            buffers["position"], buffers["velocity"], buffers["dhdpos"], buffers["total_system_energy"],
+            buffers["total_potential_energy"], buffers["total_kinetic_energy"], start)
+        buffers["temperature"][start:start + n_saved] = self._currentTemperature
+        self._traj_len += n_saved
+
+        # the final state is stored like in the python loop
+        self.step = steps - 1
+        self._currentPosition, self._currentVelocities, self._currentForce = position, velocity, force
+        self.update_system_properties()
+        self.update_current_state()
+        self._append_traj()
+        return True
 
     def propagate(self) -> (
     Union[Iterable[Number], Number], Union[Iterable[Number], Number], Union[Iterable[Number], Number]):
@@ -679,6 +1103,26 @@ class system(_baseClass):
         self._currentPosition, self._currentVelocities, self._currentForce = self.sampler.step(self)
         return self._currentPosition, self._currentVelocities, self._currentForce
 
+    @contextmanager
+    def batched_updates(self):
+        """
+            batched_updates
+                context, in which the position, velocity and temperature setters do not update the energies.
+                The energies and the current state are updated once, when the outermost context is left without an
+                exception.
+
+        """
+        previous_batch_updates = self._batch_updates
+        self._batch_updates = True
+        try:
+            yield self
+        finally:
+            self._batch_updates = previous_batch_updates
+
+        if (not previous_batch_updates):
+            self._update_energies()
+            self.update_current_state()
+
     def apply_conditions(self) -> NoReturn:
         """
             applyConditions
@@ -716,7 +1160,7 @@ class system(_baseClass):
         self._update_energies()
         self.update_current_state()
 
-        self._trajectory.append(self.current_state)
+        self._append_traj()
 
     def revert_step(self) -> NoReturn:
         """
@@ -727,27 +1171,32 @@ class system(_baseClass):
         -------
         NoReturn
         """
-        if(len(self._trajectory)>1):
-            self._trajectory.pop()
-            self._currentState = self._trajectory[-1]
-            self._update_current_vars_from_current_state()
+        if(self._traj_len>1):
+            self._traj_len -= 1
+            self._update_state_from_traj()
         else:
             warnings.warn("Could not revert step, as only 1 step is in the trajectory!")
+
     def clear_trajectory(self):
         """
         deletes all entries of trajectory and adds current state as first timestep to the trajectory
         :return: None
         """
-        self._trajectory = []
+        self._traj_buf = {field: None for field in self._state_fields}
+        self._traj_scalar = [None for _ in self._state_fields]
+        self._traj_len = 0
+        self._traj_capacity = self._traj_chunk
 
     def write_trajectory(self, out_path: str) -> str:
         """
             writeTrajectory
                 Writes the trajectory out to a file.
+                If the out_path ends with ".parquet", the trajectory buffers are written directly as parquet file (requires pyarrow),
+                otherwise the trajectory is written as csv.
         Parameters
         ----------
         out_path: str
-            the string, where the traj csv should be stored.
+            the string, where the traj csv or parquet file should be stored.
 
         Returns
         -------
@@ -761,6 +1210,23 @@ class system(_baseClass):
         """
         if (not os.path.exists(os.path.dirname(os.path.abspath(out_path)))):
             raise Exception("Could not find output folder: " + os.path.dirname(out_path))
-        traj = self.trajectory
-        traj.to_csv(out_path, header=True)
+
+        if (out_path.endswith(".parquet")):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            columns = {}
+            for field in self._state_fields:
+                buffer = self._traj_buf[field]
+                if (buffer is None):
+                    columns[field] = pa.array(np.full(self._traj_len, np.nan))
+                else:
+                    column = pa.array(buffer[:self._traj_len].ravel())
+                    for size in reversed(buffer.shape[1:]):
+                        column = pa.FixedSizeListArray.from_arrays(column, size)
+                    columns[field] = column
+            pq.write_table(pa.table(columns), out_path)
+        else:
+            traj = self.trajectory
+            traj.to_csv(out_path, header=True)
         return out_path
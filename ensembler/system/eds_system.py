@@ -4,9 +4,6 @@ Module: System
 """
 
 import numpy as np
-import pandas as pd
-
-pd.options.mode.use_inf_as_na = True
 
 from ensembler.util.ensemblerTypes import samplerCls, conditionCls, Number, Iterable, Union
 
@@ -103,7 +100,7 @@ class edsSystem(system):
                  sampler: samplerCls = metropolisMonteCarloIntegrator(),
                  conditions: Iterable[conditionCls] = [],
                  temperature: float = 298.0, start_position: Union[Number, Iterable[Number]] = None,
-                 eds_s: float = 1, eds_Eoff: Iterable[Number] = [0, 0]):
+                 eds_s: float = 1, eds_Eoff: Iterable[Number] = [0, 0], seed: int = None):
         """
             __init__
                 construct a eds-System that can be used to manage a simulation.
@@ -124,6 +121,8 @@ class edsSystem(system):
             is the S-value of the EDS-Potential
         eds_Eoff: Iterable[Number], optional
             giving the energy offsets for the
+        seed: int, optional
+            seed of the random number generator of the system
 
         """
         ################################
@@ -135,7 +134,7 @@ class edsSystem(system):
         self.state = data.envelopedPStstate
 
         super().__init__(potential=potential, sampler=sampler, conditions=conditions, temperature=temperature,
-                         start_position=start_position)
+                         start_position=start_position, seed=seed)
 
         # Output
         self.set_s(self._currentEdsS)
@@ -187,14 +186,11 @@ class edsSystem(system):
     def update_current_state(self):
         """
             updateCurrentState
-                This function updates the current state from the _current Variables.
+                This function updates the current state (in place) from the _current Variables.
         """
-        self._currentState = self.state(position=self._currentPosition, temperature=self._currentTemperature,
-                                        total_system_energy=self._currentTotE,
-                                        total_potential_energy=self._currentTotPot,
-                                        total_kinetic_energy=self._currentTotKin,
-                                        dhdpos=self._currentForce, velocity=self._currentVelocities,
-                                        s=self._currentEdsS, eoff=self._currentEdsEoffs)
+        super().update_current_state()
+        self._currentState.s = self._currentEdsS
+        self._currentState.eoff = self._currentEdsEoffs
 
     def append_state(self, new_position: Union[Number, Iterable[Number]], new_velocity: Union[Number, Iterable[Number]],
                      new_forces: Union[Number, Iterable[Number]], new_s: Union[Number, Iterable[Number]],
@@ -226,4 +222,4 @@ class edsSystem(system):
         self.update_system_properties()
         self.update_current_state()
 
-        self._trajectory.append(self.current_state)
+        self._append_traj()
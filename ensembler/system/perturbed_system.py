@@ -4,9 +4,6 @@ Module: System
 """
 
 import numpy as np
-import pandas as pd
-
-pd.options.mode.use_inf_as_na = True
 
 from ensembler.util import dataStructure as data
 from ensembler.util.ensemblerTypes import samplerCls, conditionCls
@@ -58,7 +55,8 @@ class perturbedSystem(system):
 
     def __init__(self, potential: _perturbedPotentialCls=linearCoupledPotentials(), sampler: samplerCls=metropolisMonteCarloIntegrator(),
                  conditions: Iterable[conditionCls] = [],
-                 temperature: float = 298.0, start_position: (Iterable[Number] or float) = None, lam: float = 0.0):
+                 temperature: float = 298.0, start_position: (Iterable[Number] or float) = None, lam: float = 0.0,
+                 seed: int = None):
         """
             __init__
                 construct a eds-System that can be used to manage a simulation.
@@ -77,9 +75,11 @@ class perturbedSystem(system):
             starting position for the simulation and setup of the system.
         lam: Number, optional
             the value of the copuling lambda
+        seed: int, optional
+            seed of the random number generator of the system
         """
         super().__init__(potential=potential, sampler=sampler, conditions=conditions, temperature=temperature,
-                         start_position=start_position)
+                         start_position=start_position, seed=seed)
 
         self.lam = lam
         self.update_current_state()
@@ -139,15 +139,12 @@ class perturbedSystem(system):
     def update_current_state(self):
         """
         updateCurrentState
-                This function updates the current state from the _current Variables.
+                This function updates the current state (in place) from the _current Variables.
 
         """
-        self._currentState = self.state(position=self._currentPosition, temperature=self._currentTemperature,
-                                        total_system_energy=self._currentTotE,
-                                        total_potential_energy=self._currentTotPot,
-                                        total_kinetic_energy=self._currentTotKin,
-                                        dhdpos=self._currentForce, velocity=self._currentVelocities,
-                                        lam=self._currentLambda, dhdlam=self._currentdHdLambda)
+        super().update_current_state()
+        self._currentState.lam = self._currentLambda
+        self._currentState.dhdlam = self._currentdHdLambda
 
     def append_state(self, new_position: Union[Number, Iterable[Number]], new_velocity: Union[Number, Iterable[Number]], new_forces: Union[Number, Iterable[Number]],
                      new_lambda: Number) -> NoReturn:
@@ -177,7 +174,7 @@ class perturbedSystem(system):
         self._update_dHdLambda()
         self.update_current_state()
 
-        self._trajectory.append(self.current_state)
+        self._append_traj()
 
     """
     Functionality
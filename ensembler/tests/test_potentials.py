@@ -330,6 +330,20 @@ class potentialCls_coulombPotential(test_potentialCls):
                                        err_msg="The results of " + potential.name + " are not correct!", decimal=8)
 
 
+    def test_jit_functions(self):
+        potential = OneD.coulombPotential(q1=1, q2=1, epsilon=1)
+        jit_functions = potential._jit_functions()
+        if (jit_functions is None):
+            self.skipTest("numba is not installed")
+
+        # the compiled cfuncs are called through their ctypes wrappers (calling them directly runs the python code)
+        jit_ene, jit_dVdpos = jit_functions
+        self.assertEqual(potential.ene(0.0), jit_ene.ctypes(0.0),
+                         msg="The compiled energy function does not divide by zero like the python one!")
+        self.assertEqual(potential.force(0.0), jit_dVdpos.ctypes(0.0),
+                         msg="The compiled force function does not divide by zero like the python one!")
+
+
 class potentialCls_lennardJonesPotential(test_potentialCls):
     potential_class = OneD.lennardJonesPotential
 
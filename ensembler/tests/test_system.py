@@ -1,3 +1,4 @@
+import copy
 import os
 import tempfile
 import unittest
@@ -8,6 +9,7 @@ from ensembler import samplers
 from ensembler import potentials
 from ensembler import system
 from ensembler.util import dataStructure as data
+from ensembler.util.jit import numba_available
 
 class test_System(unittest.TestCase):
     system_class = system.system
@@ -159,6 +161,37 @@ class test_System(unittest.TestCase):
         self.assertNotEqual(curState.velocity, not_expected_state.velocity,
                             msg="The not expected velocity equals the current one")
 
+    def test_revertStep_simulate_ND(self):
+        if (self.system_class is not system.system):
+            self.skipTest("the ND newtonian system is only tested for the basic system")
+
+        sys = system.system(potential=potentials.TwoD.harmonicOscillatorPotential(),
+                            sampler=samplers.newtonian.leapFrogIntegrator(), start_position=[0.5, 0.2])
+        sys.simulate(steps=5, verbosity=False)
+        sys.revert_step()
+        self.assertIsInstance(sys.current_state.position, np.ndarray,
+                              msg="The reverted position is not restored as an array!")
+        self.assertIsInstance(sys.current_state.velocity, np.ndarray,
+                              msg="The reverted velocity is not restored as an array!")
+
+        sys.simulate(steps=5, verbosity=False)
+        self.assertEqual(len(sys.trajectory), 10, msg="The simulation did not continue after reverting a step!")
+
+    def test_trajectory_ND(self):
+        if (self.system_class is not system.system):
+            self.skipTest("the ND newtonian system is only tested for the basic system")
+
+        sys = system.system(potential=potentials.TwoD.harmonicOscillatorPotential(),
+                            sampler=samplers.newtonian.leapFrogIntegrator(), start_position=[0.5, 0.2])
+        sys.simulate(steps=5, verbosity=False)
+        trajectory = sys.trajectory
+
+        for field in ("position", "velocity", "dhdpos"):
+            for value in trajectory[field]:
+                self.assertIsInstance(value, np.ndarray, msg="The trajectory " + field + " is not stored as arrays!")
+        np.testing.assert_almost_equal(2 * sys.current_state.position, trajectory.position.iloc[-1] * 2,
+                                       err_msg="The last trajectory position does not behave like an array!")
+
     def test_propergate(self):
         conditions = []
         temperature = 300
@@ -376,6 +409,164 @@ class test_System(unittest.TestCase):
         self.assertEqual(sys._currentVelocities, initialState.velocity,
                          msg="The initialState does equal the currentState after propergating in attribute: velocity!")
 
+    def test_batched_updates(self):
+        temperature = 300
+        position = [0.1]
+        new_position = 2.0
+
+        sys = self.system_class(potential=self.pot, sampler=self.sampler, start_position=position, temperature=temperature)
+        initial_potential_energy = sys.total_potential_energy
+
+        with sys.batched_updates():
+            sys.position = new_position
+            sys.temperature = 2 * temperature
+            self.assertEqual(initial_potential_energy, sys.total_potential_energy,
+                             msg="The energies were updated inside of the batched updates!")
+
+        np.testing.assert_almost_equal(sys.potential.ene(new_position), sys.total_potential_energy,
+                                       err_msg="The energies were not updated after the batched updates!")
+        self.assertEqual(new_position, sys.current_state.position,
+                         msg="The current state was not updated after the batched updates!")
+
+    def test_batched_updates_nested(self):
+        temperature = 300
+        position = [0.1]
+        new_position = 2.0
+
+        sys = self.system_class(potential=self.pot, sampler=self.sampler, start_position=position, temperature=temperature)
+        initial_potential_energy = sys.total_potential_energy
+
+        with sys.batched_updates():
+            with sys.batched_updates():
+                sys.position = new_position
+            self.assertEqual(initial_potential_energy, sys.total_potential_energy,
+                             msg="The energies were updated when leaving the inner batched updates!")
+        np.testing.assert_almost_equal(sys.potential.ene(new_position), sys.total_potential_energy,
+                                       err_msg="The energies were not updated after the outer batched updates!")
+
+        # an exception leaves the batched updates without updating the energies
+        with self.assertRaises(ValueError):
+            with sys.batched_updates():
+                sys.position = position[0]
+                raise ValueError("abort the batched updates")
+        self.assertFalse(sys._batch_updates, msg="The batched updates were not left after an exception!")
+        np.testing.assert_almost_equal(sys.potential.ene(new_position), sys.total_potential_energy,
+                                       err_msg="The energies were updated after an exception in the batched updates!")
+
+    def test_build_simulation_step(self):
+        temperature = 300
+        position = [0.1]
+        steps = 20
+
+        np.random.seed(42)
+        sys = self.system_class(potential=copy.deepcopy(self.pot), sampler=type(self.sampler)(), start_position=position,
+                                temperature=temperature, seed=42)
+        for _ in range(steps):
+            sys._simulation_step()
+
+        np.random.seed(42)
+        built_sys = self.system_class(potential=copy.deepcopy(self.pot), sampler=type(self.sampler)(),
+                                      start_position=position, temperature=temperature, seed=42)
+        simulation_step = built_sys._build_simulation_step()
+        for _ in range(steps):
+            simulation_step()
+
+        self.assertEqual(sys.current_state, built_sys.current_state,
+                         msg="The built simulation step does not reproduce _simulation_step!")
+
+    def test_commit_step(self):
+        temperature = 300
+        position = [0.1]
+        new_position = 1.5
+
+        sys = self.system_class(potential=copy.deepcopy(self.pot), sampler=self.sampler, start_position=position,
+                                temperature=temperature)
+        sys._currentPosition = new_position
+        sys.update_system_properties()
+        sys.update_current_state()
+        expected_state = sys.current_state
+
+        sys = self.system_class(potential=copy.deepcopy(self.pot), sampler=self.sampler, start_position=position,
+                                temperature=temperature)
+        sys._currentVelocities = expected_state.velocity
+        sys._currentPosition = new_position
+        sys._commit_step()
+
+        for field in data.basicState._fields:
+            np.testing.assert_equal(getattr(expected_state, field), getattr(sys.current_state, field),
+                                    err_msg="_commit_step does not update the " + field + " like update_system_properties "
+                                            "and update_current_state!")
+
+    def test_initialise_without_force(self):
+        potential = copy.deepcopy(self.pot)
+        sys = self.system_class(potential=potential, sampler=self.sampler, start_position=[0.1], temperature=300)
+        potential.force = None
+        sys.potential = potential
+
+        with self.assertWarns(UserWarning, msg="Initialising a system without a potential force did not warn!"):
+            sys.initialise()
+
+    def test_seed(self):
+        temperature = 300
+
+        sys = self.system_class(potential=self.pot, sampler=self.sampler, temperature=temperature, seed=42)
+        seeded_sys = self.system_class(potential=self.pot, sampler=self.sampler, temperature=temperature, seed=42)
+
+        np.testing.assert_equal(sys.initial_position, seeded_sys.initial_position,
+                                err_msg="The same seed did not give the same start position!")
+        np.testing.assert_equal(sys.velocity, seeded_sys.velocity,
+                                err_msg="The same seed did not give the same start velocity!")
+        np.testing.assert_equal(sys._gen_rand_vel(), seeded_sys._gen_rand_vel(),
+                                err_msg="The same seed did not give the same random velocity!")
+
+    def test_simulate_compiled(self):
+        temperature = 300
+        position = 0.1
+        velocity = 1.5
+        steps = 50
+        save_every_state = 3
+
+        if (not numba_available):
+            self.skipTest("numba is not installed")
+
+        trajectories = []
+        for compiled in (False, True):
+            sys = self.system_class(potential=copy.deepcopy(self.pot), sampler=samplers.newtonian.velocityVerletIntegrator(),
+                                    start_position=position, temperature=temperature)
+            sys._compiled_simulation = compiled
+            sys._compiled_simulation_min_steps = 1
+            sys.velocity = velocity
+
+            compiled_runs = []
+            simulate_compiled = sys._simulate_compiled
+
+            def recording_simulate_compiled(steps, save_every_state):
+                compiled_runs.append(simulate_compiled(steps=steps, save_every_state=save_every_state))
+                return compiled_runs[-1]
+
+            sys._simulate_compiled = recording_simulate_compiled
+            sys.simulate(steps=steps, save_every_state=save_every_state, withdraw_traj=True)
+            self.assertEqual([compiled], compiled_runs, msg="The simulation did not take the expected code path!")
+            trajectories.append(sys.trajectory)
+
+        python_traj, compiled_traj = trajectories
+        self.assertEqual(python_traj.shape, compiled_traj.shape, msg="The compiled simulation did not store the same states!")
+        for field in python_traj.columns:
+            np.testing.assert_allclose(np.array(python_traj[field].tolist(), dtype=float),
+                                       np.array(compiled_traj[field].tolist(), dtype=float),
+                                       rtol=1e-9, err_msg="The compiled simulation does not reproduce " + field + "!")
+
+        # a new potential instance reuses the compiled simulation loop
+        n_signatures = len(system.basic_system._newtonian_simulation.signatures)
+        sys = self.system_class(potential=potentials.OneD.harmonicOscillatorPotential(k=2.0),
+                                sampler=samplers.newtonian.velocityVerletIntegrator(), start_position=position,
+                                temperature=temperature)
+        sys._compiled_simulation_min_steps = 1
+        self.assertTrue(sys._simulate_compiled(steps=steps, save_every_state=save_every_state),
+                        msg="The simulation with a new potential did not take the compiled path!")
+        self.assertEqual(n_signatures, len(system.basic_system._newtonian_simulation.signatures),
+                         msg="The simulation loop was compiled again for a new potential instance!")
+
     def test_get_Pot(self):
         conditions = []
         temperature = 300
@@ -398,6 +589,93 @@ class test_System(unittest.TestCase):
         sys.simulate(steps=10)
         traj_pd = sys.trajectory
 
+    def test_simulate_save_every_state(self):
+        temperature = 300
+        position = [0.1]
+        steps = 10
+        save_every_state = 3
+
+        sys = self.system_class(potential=self.pot, sampler=self.sampler, start_position=position, temperature=temperature)
+        sys.simulate(steps=steps, save_every_state=save_every_state, withdraw_traj=True, verbosity=False)
+
+        # initial state + steps 0, 3, 6 + last state
+        self.assertEqual(5, len(sys.trajectory), msg="The simulation did not store every save_every_state-th step!")
+        self.assertEqual(steps - 1, sys.step, msg="The simulation did not run all steps!")
+        np.testing.assert_almost_equal(sys.current_state.position, sys.trajectory.position.iloc[-1],
+                                       err_msg="The last state does not equal the current state!")
+
+    def test_trajectory_buffer_growth(self):
+        temperature = 300
+        position = [0.1]
+
+        sys = self.system_class(potential=self.pot, sampler=self.sampler, start_position=position, temperature=temperature)
+        init_state = sys.current_state
+        steps = sys._traj_chunk + 10
+        sys.simulate(steps=steps, verbosity=False)
+        trajectory = sys.trajectory
+
+        self.assertEqual(steps + 1, len(trajectory), msg="The trajectory buffer did not grow with the simulation!")
+        np.testing.assert_almost_equal(init_state.position, trajectory.position.iloc[0],
+                                       err_msg="The initial state got lost while growing the trajectory buffer!")
+        np.testing.assert_almost_equal(sys.current_state.position, trajectory.position.iloc[-1],
+                                       err_msg="The last state does not equal the current state!")
+
+    def test_trajectory_preallocation(self):
+        temperature = 300
+        position = [0.1]
+        save_every_state = 3
+
+        sys = self.system_class(potential=self.pot, sampler=self.sampler, start_position=position, temperature=temperature)
+        capacities = []
+        reserve_traj = sys._reserve_traj
+
+        def recording_reserve_traj(n_states):
+            reserve_traj(n_states)
+            capacities.append(sys._traj_capacity)
+
+        sys._reserve_traj = recording_reserve_traj
+        steps = save_every_state * sys._traj_chunk + 2
+        sys.simulate(steps=steps, save_every_state=save_every_state, withdraw_traj=True, verbosity=False)
+
+        self.assertEqual(1 + sys._n_saved_states(steps, save_every_state), len(sys.trajectory),
+                         msg="The simulation did not store the expected number of states!")
+        self.assertEqual(1, len(set(capacities)), msg="The trajectory buffers were reallocated during the simulation!")
+        self.assertGreaterEqual(sys._traj_capacity, len(sys.trajectory),
+                                msg="The trajectory buffers can not hold the stored states!")
+
+        # repeated short simulations grow the buffers geometrically
+        capacities.clear()
+        for _ in range(400):
+            sys.simulate(steps=10, verbosity=False)
+        self.assertLess(len(set(capacities)), 10, msg="The trajectory buffers were reallocated too often!")
+
+    def test_write_trajectory(self):
+        steps = 10
+        sys = self.system_class(potential=self.pot, sampler=self.sampler)
+        sys.simulate(steps=steps, verbosity=False)
+
+        out_path = sys.write_trajectory(out_path=os.path.join(__class__.tmp_test_dir, "traj_" + self.system_class.name + ".csv"))
+        with open(out_path, "r") as traj_file:
+            lines = traj_file.readlines()
+        self.assertEqual(steps + 2, len(lines), msg="The written trajectory has not the expected number of lines!")
+
+    def test_write_trajectory_parquet(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+
+        steps = 10
+        sys = self.system_class(potential=self.pot, sampler=self.sampler)
+        sys.simulate(steps=steps, verbosity=False)
+
+        out_path = sys.write_trajectory(out_path=os.path.join(__class__.tmp_test_dir, "traj_" + self.system_class.name + ".parquet"))
+        table = pq.read_table(out_path)
+        self.assertEqual(steps + 1, table.num_rows, msg="The written trajectory has not the expected number of rows!")
+        self.assertEqual(list(sys.state._fields), table.column_names, msg="The written trajectory has not the state fields as columns!")
+        np.testing.assert_almost_equal(sys.trajectory.total_potential_energy, table.column("total_potential_energy").to_numpy(),
+                                       err_msg="The written potential energies do not equal the trajectory!")
+
     def test_save_obj_str(self):
         path = self.tmp_out_path
         out_path = self.system_class(potential=self.pot, sampler=self.sampler).save(path=path)
@@ -542,6 +820,9 @@ class test_perturbedSystem1D(test_System):
         self.assertEqual(curState.lam, expected_state.lam, msg="The initialised lam is not correct!")
         # self.assertEqual(np.isnan(curState.dhdlam), np.isnan(expected_state.dhdlam), msg="The initialised dHdlam is not correct!")
 
+    def test_simulate_compiled(self):
+        self.skipTest("the compiled simulation is only available for the basic system")
+
     def test_revertStep(self):
         newPosition = 10
         newVelocity = -5
@@ -650,8 +931,8 @@ class test_perturbedSystem1D(test_System):
 
         old_frame = trajectory.iloc[0]
         # Check that the first frame is the initial state!
-        self.assertListEqual(list(init_state.position), list(old_frame.position),
-                             msg="The initial state does not equal the frame 0 after propergating in attribute: Position!")
+        np.testing.assert_almost_equal(init_state.position, old_frame.position,
+                                       err_msg="The initial state does not equal the frame 0 after propergating in attribute: Position!")
         self.assertEqual(init_state.temperature, old_frame.temperature,
                          msg="The initial state does not equal the frame 0 after propergating in attribute: temperature!")
         self.assertAlmostEqual(init_state.total_potential_energy, old_frame.total_potential_energy,
@@ -956,6 +1237,9 @@ class test_edsSystem1D(test_System):
         self.assertEqual(curState.s, expected_state.s, msg="The initialised s is not correct!")
         self.assertEqual(curState.eoff, expected_state.eoff, msg="The initialised Eoff is not correct!")
 
+    def test_simulate_compiled(self):
+        self.skipTest("the compiled simulation is only available for the basic system")
+
     def test_revertStep(self):
         newPosition = 10
         newVelocity = -5
@@ -986,7 +1270,7 @@ class test_edsSystem1D(test_System):
         expected_state = sys.current_state
         sys.append_state(new_position=newPosition2, new_velocity=newVelocity2, new_forces=newForces2, new_s=newS2, new_eoff=newEoff2)
         not_expected_state = sys.current_state
-        print(len(sys._trajectory), sys._trajectory)
+        print(len(sys.trajectory), sys.trajectory)
         sys.revert_step()
         curState = sys.current_state
         print(curState)
@@ -1026,7 +1310,7 @@ class test_edsSystem1D(test_System):
         self.assertNotEqual(curState.velocity, not_expected_state.velocity,
                             msg="The not expected velocity equals the current one")
         self.assertNotEqual(curState.s, not_expected_state.s, msg="The not expected lam equals the current one")
-        self.assertNotEqual(curState.eoff, not_expected_state.eoff, msg="The initialised Eoff is not correct!")
+        self.assertFalse(np.array_equal(curState.eoff, not_expected_state.eoff), msg="The initialised Eoff is not correct!")
 
     def test_propergate(self):
         temperature = 300
@@ -1072,8 +1356,8 @@ class test_edsSystem1D(test_System):
 
         old_frame = trajectory.iloc[0]
         # Check that the first frame is the initial state!
-        self.assertListEqual(list(init_state.position), list(old_frame.position),
-                             msg="The initial state does not equal the frame 0 after propergating in attribute: Position!")
+        np.testing.assert_almost_equal(init_state.position, old_frame.position,
+                                       err_msg="The initial state does not equal the frame 0 after propergating in attribute: Position!")
         self.assertEqual(init_state.temperature, old_frame.temperature,
                          msg="The initial state does not equal the frame 0 after propergating in attribute: temperature!")
         self.assertAlmostEqual(init_state.total_potential_energy, old_frame.total_potential_energy,
@@ -1113,9 +1397,9 @@ class test_edsSystem1D(test_System):
             self.assertEqual(init_state.s, old_frame.s,
                              msg="The frame " + str(ind) + " equals the frame  " + str(
                                  ind + 1) + " after propergating in attribute: s!")
-            self.assertEqual(init_state.eoff, old_frame.eoff,
-                             msg="The frame " + str(ind) + " equals the frame  " + str(
-                                 ind + 1) + " after propergating in attribute: Eoff!")
+            np.testing.assert_array_equal(init_state.eoff, old_frame.eoff,
+                                          err_msg="The frame " + str(ind) + " equals the frame  " + str(
+                                              ind + 1) + " after propergating in attribute: Eoff!")
             old_frame = frame
 
     def test_applyConditions(self):
@@ -2,8 +2,8 @@
 Module: dataStructure
     This module contains all needed data Structures for the project.
 """
-from collections import namedtuple
 import __main__
+from operator import attrgetter
 
 """
 States
@@ -12,17 +12,83 @@ States
     
     The states also define the variables contained in a trajectory.
 """
+
+
+class _state:
+    """
+        _state
+            base class of all states. A state has a fixed set of fields (stored in __slots__) and can be updated in place,
+            so a system does not need to construct a new state for every step.
+            Otherwise it behaves like a namedtuple (iteration, indexing, _fields, _asdict).
+    """
+    __slots__ = ()
+    _fields = ()
+    _get_values = staticmethod(lambda state: ())  # returns the values of all fields as tuple (see _new_state)
+
+    def __init__(self, *args, **kwargs):
+        if (len(args) > len(self._fields)):
+            raise TypeError(self.__class__.__name__ + " takes " + str(len(self._fields)) + " arguments, but " + str(
+                len(args)) + " were given")
+        for field, value in zip(self._fields, args):
+            setattr(self, field, value)
+        for field in self._fields[len(args):]:
+            if (field not in kwargs):
+                raise TypeError(self.__class__.__name__ + " is missing the argument: " + field)
+            setattr(self, field, kwargs.pop(field))
+        if (len(kwargs) > 0):
+            raise TypeError(self.__class__.__name__ + " got unexpected arguments: " + str(list(kwargs.keys())))
+
+    def __iter__(self):
+        return iter(self._get_values(self))
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return self._get_values(self)[index]
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, _state) and self._fields == other._fields
+                and self._get_values(self) == other._get_values(other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__ + "(" + ", ".join(
+            [field + "=" + repr(getattr(self, field)) for field in self._fields]) + ")"
+
+    def _asdict(self) -> dict:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def copy(self):
+        """
+            copy
+                returns a new state with the same values.
+        """
+        return self.__class__(*self)
+
+
+def _new_state(name: str, fields: list) -> type:
+    """
+        _new_state
+            generates a new state class with the given fields.
+    """
+    fields = tuple(fields)
+    get_values = attrgetter(*fields) if (len(fields) > 1) else (lambda state: tuple(getattr(state, field) for field in fields))
+    return type(name, (_state,), {"__slots__": fields, "_fields": fields, "_get_values": staticmethod(get_values)})
+
+
 # states:
-basicState = namedtuple("State", ["position", "temperature",
+basicState = _new_state("State", ["position", "temperature",
                                   "total_system_energy", "total_potential_energy", "total_kinetic_energy",
                                   "dhdpos", "velocity"])
 
-lambdaState = namedtuple("Lambda_State", ["position", "temperature",
+lambdaState = _new_state("Lambda_State", ["position", "temperature",
                                           "total_system_energy", "total_potential_energy", "total_kinetic_energy",
                                           "dhdpos", "velocity",
                                           "lam", "dhdlam"])
 
-envelopedPStstate = namedtuple("EDS_State", ["position", "temperature",
+envelopedPStstate = _new_state("EDS_State", ["position", "temperature",
                                              "total_system_energy", "total_potential_energy", "total_kinetic_energy",
                                              "dhdpos", "velocity",
                                              "s", "eoff"])
@@ -37,4 +103,3 @@ lambdaState.__module__ = "__main__"
 
 setattr(__main__, envelopedPStstate.__name__, envelopedPStstate)
 envelopedPStstate.__module__ = "__main__"
-
@@ -3,7 +3,7 @@
 """
 
 # Generic Types - provided to all other files from here
-from typing import TypeVar, Union, List, Tuple, Iterable, Dict, NoReturn
+from typing import TypeVar, Union, List, Tuple, Iterable, Dict, NoReturn, Callable
 from numbers import Number
 
 # Dummy defs:
@@ -0,0 +1,25 @@
+"""
+Module: jit
+    This module provides the numba decorators used for the performance critical kernels of ensembler.
+    numba is optional - if it is not installed, the kernels are executed as plain python/numpy functions.
+"""
+
+try:
+    from numba import njit, cfunc
+
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+    def njit(*args, **kwargs):
+        """
+            njit
+                fallback for numba.njit, returns the function unchanged.
+        """
+        if (len(args) == 1 and callable(args[0]) and not kwargs):
+            return args[0]
+        else:
+            return lambda func: func
+
+    # fallback for numba.cfunc - the function is used unchanged, like with njit
+    cfunc = njit
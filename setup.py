@@ -54,6 +54,12 @@ EXTRAS = {"docs":[
            'sphinx_rtd_theme', #Documentation: style
            'nbsphinx', #Documentation: for inclusion of jupyter notebooks
            'm2r', #Documentation: converts markdown to rst
+           ],
+          "numba":[
+           'numba', #Code: jit compiled simulation kernels
+           ],
+          "parquet":[
+           'pyarrow', #Code: writing trajectories as parquet files
            ]
          }
 